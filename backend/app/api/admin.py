@@ -0,0 +1,54 @@
+"""Admin diagnostics endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from app.config import settings
+from app.services.diagnostics import capture_profile, loop_watchdog
+
+_profile_lock = asyncio.Lock()
+
+
+def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    if not settings.admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="admin_endpoints_disabled",
+        )
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token, settings.admin_token
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="invalid_admin_token",
+        )
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/loop")
+async def loop_stats() -> Dict[str, Any]:
+    """Event-loop lag percentiles and the most recent stall stack."""
+    return loop_watchdog.stats()
+
+
+@router.post("/profile")
+async def profile(
+    seconds: float = Query(default=5.0, gt=0, le=60),
+    interval_ms: float = Query(default=5.0, ge=1, le=100),
+    top: int = Query(default=25, ge=1, le=200),
+) -> Dict[str, Any]:
+    """Capture a time-boxed stack-sampling profile and tracemalloc top-N."""
+    if _profile_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="profile_in_progress",
+        )
+    async with _profile_lock:
+        return await capture_profile(seconds, interval_ms / 1000, top)
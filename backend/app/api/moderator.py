@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Any, Dict, List
 
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks, Depends
 
+from app.api.admin import require_admin
 from app.schemas.moderator import ModeratorGuidanceRequest, ModeratorGuidanceResponse
-from app.api.sessions import _sessions
+from app.schemas.sessions import ChecklistKey
+from app.services.log_pipeline import bind_log_context
 from app.services.moderator_engine import moderator_engine
+from app.services.session_store import get_session_store, record_guidance
+from app.services.shadow_evaluator import shadow_evaluator
+from app.services.supervisor_feed import supervisor_feed
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +25,49 @@ router = APIRouter()
 @router.post("/guidance", response_model=ModeratorGuidanceResponse)
 async def generate_guidance(
     payload: ModeratorGuidanceRequest,
+    background_tasks: BackgroundTasks,
 ) -> ModeratorGuidanceResponse:
-    # Session validation is soft - allows guidance to work after server hot-reload
-    if payload.session_id and payload.session_id not in _sessions:
-        logger.warning("Session %s not found (server may have restarted)", payload.session_id)
+    store = get_session_store()
+    session = None
+    prior_completed: List[ChecklistKey] = []
+    if payload.session_id:
+        bind_log_context(session_id=payload.session_id)
+        session = await store.get(payload.session_id)
+        # Session validation is soft - allows guidance to work after server hot-reload
+        if session is None:
+            logger.warning(
+                "Session %s not found (server may have restarted)", payload.session_id
+            )
+        else:
+            prior_completed = list(session.get("completed_items") or [])  # type: ignore[call-overload]
 
-    guidance = await moderator_engine.analyse(payload.transcript)
+    started = time.perf_counter()
+    guidance = await moderator_engine.analyse(payload.transcript, prior_completed)
+    bind_log_context(guidance_id=guidance.guidance_id)
+    if session is not None:
+        record_guidance(session, guidance)
+        await store.save(session)
+    if payload.session_id:
+        supervisor_feed.publish(payload.session_id, guidance)
+    if shadow_evaluator.should_sample():
+        # Background tasks run after the response is sent.
+        background_tasks.add_task(
+            shadow_evaluator.submit,
+            payload.transcript,
+            prior_completed,
+            guidance,
+            time.perf_counter() - started,
+        )
     return guidance
+
+
+@router.get("/stats", dependencies=[Depends(require_admin)])
+async def completion_stats() -> Dict[str, Dict[str, Any]]:
+    """Per output mode and route: calls, latency, and token totals since startup."""
+    return moderator_engine.completion_stats()
+
+
+@router.get("/shadow", dependencies=[Depends(require_admin)])
+async def shadow_report() -> Dict[str, Any]:
+    """Shadow evaluation totals and the most recent primary/candidate comparisons."""
+    return shadow_evaluator.report()
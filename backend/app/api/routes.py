@@ -2,9 +2,13 @@
 
 from fastapi import APIRouter
 
-from . import health, moderator, sessions
+from . import admin, health, moderator, sessions, supervisor
 
 api_router = APIRouter()
 api_router.include_router(health.router, prefix="/health", tags=["Health"])
 api_router.include_router(sessions.router, prefix="/sessions", tags=["Sessions"])
 api_router.include_router(moderator.router, prefix="/moderator", tags=["Moderator"])
+api_router.include_router(
+    supervisor.router, prefix="/supervisor", tags=["Supervisor"]
+)
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
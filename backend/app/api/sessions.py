@@ -2,26 +2,65 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict
+from typing import AsyncIterator
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from app.schemas.sessions import SessionCreateRequest, SessionResponse
+from app.config import settings
+from app.schemas.sessions import (
+    BulkSessionCreateRequest,
+    BulkSessionResult,
+    SessionConfig,
+    SessionCreateRequest,
+    SessionResponse,
+)
+from app.services.log_pipeline import bind_log_context
 from app.services.prompt_builder import prompt_builder
 from app.services.provider_factory import mint_session
+from app.services.session_store import SessionState, get_session_store
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-class SessionState(Dict[str, object]): ...
+async def _start_session(config: SessionConfig) -> SessionResponse:
+    """Mint a realtime key and register the session.
 
+    Raises ``ValueError`` for configuration problems and ``RuntimeError`` when
+    the provider rejects the request.
+    """
+    session_id = str(uuid4())
+    bind_log_context(session_id=session_id)
+    ephemeral_key, expires_at, webrtc_url = await mint_session(config)
+
+    conversation_token = str(uuid4())
+
+    await get_session_store().save(
+        SessionState(
+            session_id=session_id,
+            conversation_token=conversation_token,
+            created_at=datetime.utcnow(),
+            checklist=config.checklist,
+        )
+    )
 
-_sessions: Dict[str, SessionState] = {}
+    return SessionResponse(
+        session_id=session_id,
+        conversation_token=conversation_token,
+        provider=config.provider,
+        model=config.model,
+        webrtc_url=webrtc_url,
+        ephemeral_key=ephemeral_key,
+        expires_at=expires_at,
+        voice_name=config.voice,
+        checklist=config.checklist,
+    )
 
 
 @router.post("", response_model=SessionResponse)
@@ -32,7 +71,7 @@ async def create_session(
         payload.participant_name if payload else None
     )
     try:
-        ephemeral_key, expires_at, webrtc_url = await mint_session(config)
+        return await _start_session(config)
     except ValueError as exc:
         logger.error("Session creation failed (config error): %s", exc)
         raise HTTPException(
@@ -46,24 +85,56 @@ async def create_session(
             detail="realtime_session_failed",
         ) from exc
 
-    session_id = str(uuid4())
-    conversation_token = str(uuid4())
 
-    _sessions[session_id] = {
-        "session_id": session_id,
-        "conversation_token": conversation_token,
-        "created_at": datetime.utcnow(),
-        "checklist": config.checklist,
-    }
+@router.post("/bulk")
+async def create_sessions_bulk(payload: BulkSessionCreateRequest) -> StreamingResponse:
+    """Create one session per participant, streaming NDJSON results as they finish."""
+    if len(payload.participants) > settings.bulk_session_max_participants:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"at most {settings.bulk_session_max_participants} participants per request",
+        )
 
-    return SessionResponse(
-        session_id=session_id,
-        conversation_token=conversation_token,
-        provider=config.provider,
-        model=config.model,
-        webrtc_url=webrtc_url,
-        ephemeral_key=ephemeral_key,
-        expires_at=expires_at,
-        voice_name=config.voice,
-        checklist=config.checklist,
+    limit = min(
+        payload.max_concurrency or settings.bulk_session_concurrency,
+        settings.bulk_session_concurrency,
     )
+    semaphore = asyncio.Semaphore(limit)
+
+    async def start(index: int, participant: SessionCreateRequest) -> BulkSessionResult:
+        name = participant.participant_name
+        result = BulkSessionResult(index=index, participant_name=name, ok=False)
+        async with semaphore:
+            try:
+                result.session = await _start_session(
+                    prompt_builder.build_session_config(name)
+                )
+                result.ok = True
+            except ValueError as exc:
+                logger.error("Bulk session %s failed (config error): %s", index, exc)
+                result.error = str(exc)
+            except RuntimeError as exc:
+                logger.error("Bulk session %s failed (provider error): %s", index, exc)
+                result.error = "realtime_session_failed"
+            except Exception as exc:
+                # One participant's failure must not end the stream.
+                logger.error(
+                    "Bulk session %s failed (%s): %s", index, type(exc).__name__, exc
+                )
+                result.error = "realtime_session_failed"
+        return result
+
+    async def stream() -> AsyncIterator[str]:
+        tasks = [
+            asyncio.create_task(start(index, participant))
+            for index, participant in enumerate(payload.participants)
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield (await finished).model_dump_json() + "\n"
+        finally:
+            # Client went away or the stream finished: stop any pending mints.
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
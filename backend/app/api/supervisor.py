@@ -0,0 +1,65 @@
+"""Supervisor live feed endpoint."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.api.admin import require_admin
+from app.config import settings
+from app.services.supervisor_feed import supervisor_feed
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+KEEPALIVE_SECONDS = 15.0
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+@router.get("/feed")
+async def feed() -> StreamingResponse:
+    """Server-sent events: a ``snapshot`` of all sessions, then ``update`` batches.
+
+    The feed lives in process memory, so with several server workers each one
+    would only see the guidance calls it handled; it is refused in that case
+    rather than serving a partial view.
+    """
+    if settings.server_workers > 1:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="supervisor_feed_requires_single_worker",
+        )
+    if supervisor_feed.full:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="too_many_supervisors",
+        )
+    subscription = supervisor_feed.subscribe()
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            while True:
+                if subscription.needs_snapshot:
+                    yield _sse("snapshot", supervisor_feed.snapshot(subscription))
+                    continue
+                if not await subscription.wait(KEEPALIVE_SECONDS):
+                    yield ": keepalive\n\n"
+                    continue
+                if subscription.needs_snapshot:
+                    continue
+                updates = subscription.drain()
+                if updates:
+                    yield _sse("update", [update.as_event() for update in updates])
+        finally:
+            supervisor_feed.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
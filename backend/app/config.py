@@ -7,7 +7,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
@@ -18,12 +18,14 @@ ProviderName = Literal["azure", "openai"]
 OPENAI_REALTIME_CLIENT_SECRETS_URL = "https://api.openai.com/v1/realtime/client_secrets"
 OPENAI_REALTIME_WEBRTC_URL = "https://api.openai.com/v1/realtime/calls"
 
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
 
 class Settings(BaseSettings):
     """Runtime configuration loaded from the environment."""
 
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).resolve().parent.parent / ".env",
+        env_file=BACKEND_DIR / ".env",
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -55,10 +57,145 @@ class Settings(BaseSettings):
         default="gpt-5-chat-latest", alias="OPENAI_MODERATOR_MODEL"
     )
 
+    # Optional fast moderator model for routine checklist-progression turns.
+    # Routing is disabled (every turn uses the strong model) when unset.
+    openai_moderator_fast_model: str | None = Field(
+        default=None, alias="OPENAI_MODERATOR_FAST_MODEL"
+    )
+    azure_openai_moderator_fast_deployment: str | None = Field(
+        default=None, alias="AZURE_OPENAI_MODERATOR_FAST_DEPLOYMENT"
+    )
+    # Out-of-order checklist gaps (missing items before a completed one) at or
+    # above which a turn counts as ambiguous and goes to the strong model.
+    moderator_route_gap_threshold: int = Field(
+        default=2, alias="MODERATOR_ROUTE_GAP_THRESHOLD"
+    )
+    # Remaining checklist items at or below which the closing summary is due
+    # and the strong model takes over.
+    moderator_route_closing_items: int = Field(
+        default=1, alias="MODERATOR_ROUTE_CLOSING_ITEMS"
+    )
+
+    # Moderator guidance output: free-text envelope or compact JSON directive
+    moderator_output_mode: Literal["text", "structured"] = Field(
+        default="text", alias="MODERATOR_OUTPUT_MODE"
+    )
+    moderator_structured_max_tokens: int = Field(
+        default=120, alias="MODERATOR_STRUCTURED_MAX_TOKENS"
+    )
+
+    # Shadow evaluation of a candidate moderator configuration. A share of live
+    # guidance calls is replayed against the candidate after the response is
+    # sent; unset candidate fields inherit the live configuration.
+    moderator_shadow_sample_rate: float = Field(
+        default=0.0, ge=0.0, le=1.0, alias="MODERATOR_SHADOW_SAMPLE_RATE"
+    )
+    moderator_shadow_model: str | None = Field(
+        default=None, alias="MODERATOR_SHADOW_MODEL"
+    )
+    moderator_shadow_instructions: Path | None = Field(
+        default=None, alias="MODERATOR_SHADOW_INSTRUCTIONS"
+    )
+    moderator_shadow_output_mode: Literal["text", "structured"] | None = Field(
+        default=None, alias="MODERATOR_SHADOW_OUTPUT_MODE"
+    )
+    moderator_shadow_keywords: dict[str, list[str]] | None = Field(
+        default=None, alias="MODERATOR_SHADOW_KEYWORDS"
+    )
+    moderator_shadow_queue_size: int = Field(
+        default=32, ge=1, alias="MODERATOR_SHADOW_QUEUE_SIZE"
+    )
+    moderator_shadow_workers: int = Field(
+        default=1, ge=1, alias="MODERATOR_SHADOW_WORKERS"
+    )
+
+    # Event-loop watchdog: heartbeat interval (0 disables) and the stall length
+    # that triggers a logged stack snapshot of the loop thread.
+    loop_watchdog_interval_ms: int = Field(
+        default=100, ge=0, alias="LOOP_WATCHDOG_INTERVAL_MS"
+    )
+    loop_watchdog_threshold_ms: int = Field(
+        default=250, ge=1, alias="LOOP_WATCHDOG_THRESHOLD_MS"
+    )
+    # Admin diagnostics endpoints are disabled unless a token is configured.
+    admin_token: str | None = Field(default=None, alias="ADMIN_TOKEN")
+
+    # Session registry: per-process memory (development), a SQLite file in WAL
+    # mode that every worker process can share, or a per-process cache that
+    # persists to the same SQLite file in batches (survives restarts).
+    session_store: Literal["memory", "sqlite", "write_behind"] = Field(
+        default="memory", alias="SESSION_STORE"
+    )
+    session_store_path: Path = Field(
+        default=BACKEND_DIR / ".data" / "sessions.sqlite3", alias="SESSION_STORE_PATH"
+    )
+    session_flush_interval_ms: int = Field(
+        default=500, ge=1, alias="SESSION_FLUSH_INTERVAL_MS"
+    )
+    session_flush_batch_size: int = Field(
+        default=200, ge=1, alias="SESSION_FLUSH_BATCH_SIZE"
+    )
+    session_cache_size: int = Field(default=10000, ge=1, alias="SESSION_CACHE_SIZE")
+    session_guidance_history: int = Field(
+        default=10, ge=1, alias="SESSION_GUIDANCE_HISTORY"
+    )
+
+    # Bulk session creation: per-request participant cap and the upper bound on
+    # concurrent provider mints (requests may ask for fewer).
+    bulk_session_max_participants: int = Field(
+        default=500, ge=1, alias="BULK_SESSION_MAX_PARTICIPANTS"
+    )
+    bulk_session_concurrency: int = Field(
+        default=16, ge=1, alias="BULK_SESSION_CONCURRENCY"
+    )
+
+    # Supervisor SSE feed: concurrent subscribers, per-subscriber coalesced
+    # backlog before a resync snapshot, and how long idle sessions are listed.
+    supervisor_max_subscribers: int = Field(
+        default=50, ge=1, alias="SUPERVISOR_MAX_SUBSCRIBERS"
+    )
+    supervisor_max_pending: int = Field(
+        default=1000, ge=1, alias="SUPERVISOR_MAX_PENDING"
+    )
+    supervisor_session_ttl_seconds: int = Field(
+        default=1800, ge=1, alias="SUPERVISOR_SESSION_TTL_SECONDS"
+    )
+
+    # Logging: records are queued and written as JSON (or text) by a
+    # background thread; long messages are clipped and repeated warnings and
+    # errors are limited to a burst per window.
+    log_level: str = Field(default="WARNING", alias="LOG_LEVEL")
+    log_format: Literal["json", "text"] = Field(default="json", alias="LOG_FORMAT")
+    log_queue_size: int = Field(default=10000, ge=1, alias="LOG_QUEUE_SIZE")
+    log_max_message_chars: int = Field(
+        default=2000, ge=100, alias="LOG_MAX_MESSAGE_CHARS"
+    )
+    log_error_burst: int = Field(default=5, ge=1, alias="LOG_ERROR_BURST")
+    log_error_window_seconds: float = Field(
+        default=60.0, gt=0, alias="LOG_ERROR_WINDOW_SECONDS"
+    )
+
+    # Production server (python -m app.server); 0 workers means one per CPU.
+    server_workers: int = Field(default=0, ge=0, alias="SERVER_WORKERS")
+
     # Hardcoded for simplicity
     realtime_model: str = "gpt-realtime"
     cors_origins: list[str] = ["http://localhost:5173"]
 
+    @model_validator(mode="after")
+    def _check_loop_watchdog(self) -> Settings:
+        # A threshold at or below the interval would count every ordinary gap
+        # between heartbeats as a stall.
+        if (
+            self.loop_watchdog_interval_ms > 0
+            and self.loop_watchdog_threshold_ms <= self.loop_watchdog_interval_ms
+        ):
+            raise ValueError(
+                "LOOP_WATCHDOG_THRESHOLD_MS must be greater than "
+                "LOOP_WATCHDOG_INTERVAL_MS"
+            )
+        return self
+
     def get_webrtc_url(self) -> str:
         """Return the WebRTC gateway URL configured for realtime sessions."""
         if self.provider == "openai":
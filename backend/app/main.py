@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import api_router
 from app.config import settings
+from app.services.diagnostics import loop_watchdog
+from app.services.log_pipeline import LogContextMiddleware, log_pipeline
+from app.services.session_store import get_session_store
+from app.services.shadow_evaluator import shadow_evaluator
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Started here rather than at import so each forked worker runs its own
+    # listener thread.
+    log_pipeline.start()
+    if settings.loop_watchdog_interval_ms > 0:
+        loop_watchdog.start()
+    shadow_evaluator.start()
+    try:
+        yield
+    finally:
+        await shadow_evaluator.stop()
+        await loop_watchdog.stop()
+        # Write-behind stores hold unflushed session updates in memory.
+        await get_session_store().close()
+        log_pipeline.stop()
+
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     docs_url="/docs",
     redoc_url=None,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -23,6 +50,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(LogContextMiddleware)
+
 app.include_router(api_router, prefix="/api")
 
 
@@ -31,9 +31,18 @@ class ModeratorGuidanceResponse(BaseModel):
     next_poll_seconds: int | None = None
 
 
+class StructuredGuidance(BaseModel):
+    """Compact guidance returned by the moderator in structured output mode."""
+
+    directive: str = Field(..., min_length=1, max_length=200)
+    target_item: Optional[ChecklistKey] = None
+    suggested_phrase: Optional[str] = Field(default=None, max_length=240)
+
+
 __all__ = [
     "ModeratorGuidanceRequest",
     "ModeratorGuidanceResponse",
+    "StructuredGuidance",
     "TranscriptSegment",
     "ToneLabel",
 ]
@@ -38,3 +38,18 @@ class SessionResponse(BaseModel):
     expires_at: datetime
     voice_name: str
     checklist: List[ChecklistKey]
+
+
+class BulkSessionCreateRequest(BaseModel):
+    participants: List[SessionCreateRequest] = Field(..., min_length=1)
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+
+
+class BulkSessionResult(BaseModel):
+    """One NDJSON line of the bulk session stream, emitted as each mint finishes."""
+
+    index: int
+    participant_name: Optional[str] = None
+    ok: bool
+    session: Optional[SessionResponse] = None
+    error: Optional[str] = None
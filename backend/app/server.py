@@ -0,0 +1,152 @@
+"""Production server entry point.
+
+Imports the application once, binds the listening socket, then forks worker
+processes that each run uvicorn with uvloop and httptools on the shared socket.
+The parent supervises the workers, restarting any that die and forwarding
+SIGINT/SIGTERM for a graceful shutdown.
+
+Usage (from ``backend/``)::
+
+    SESSION_STORE=sqlite python -m app.server --workers 4 --port 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List
+
+import uvicorn
+
+from app.config import settings
+
+logger = logging.getLogger("app.server")
+
+RESTART_BACKOFF_S = 1.0
+
+
+def _run_worker(config: uvicorn.Config, sock: socket.socket) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _spawn(config: uvicorn.Config, sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 0
+        try:
+            _run_worker(config, sock)
+        except BaseException:
+            # Never return into the parent's supervision loop.
+            logger.exception("Worker %s crashed", os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+    logger.info("Started worker %s", pid)
+    return pid
+
+
+def _supervise(config: uvicorn.Config, sock: socket.socket, workers: int) -> int:
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def shutdown(signum: int, _frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    for _ in range(workers):
+        children[_spawn(config, sock)] = time.monotonic()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started_at = children.pop(pid, None)
+        if started_at is None or stopping:
+            continue
+        logger.warning(
+            "Worker %s exited with status %s; restarting",
+            pid,
+            os.waitstatus_to_exitcode(status),
+        )
+        if time.monotonic() - started_at < RESTART_BACKOFF_S:
+            time.sleep(RESTART_BACKOFF_S)
+        children[_spawn(config, sock)] = time.monotonic()
+    return 0
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the backend for production.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.server_workers or os.cpu_count() or 1,
+        help="Worker processes (default SERVER_WORKERS, else one per CPU).",
+    )
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper())
+
+    can_fork = hasattr(os, "fork")
+    workers = max(1, args.workers) if can_fork else 1
+    if workers > 1 and settings.session_store != "sqlite":
+        logger.error(
+            "SESSION_STORE=%s cannot be shared by %s workers; "
+            "set SESSION_STORE=sqlite or pass --workers 1",
+            settings.session_store,
+            workers,
+        )
+        return 2
+    # Forked workers inherit the resolved count; per-process features such as
+    # the supervisor feed check it.
+    settings.server_workers = workers
+
+    # Preload: import the app (prompts, moderator engine, routers) once in the
+    # parent so forked workers start with it already in memory.
+    from app.main import app
+
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        loop="uvloop",
+        http="httptools",
+        log_level=args.log_level,
+        proxy_headers=True,
+        access_log=False,
+    )
+    if workers == 1:
+        uvicorn.Server(config).run()
+        return 0
+
+    sock = config.bind_socket()
+    logger.info("Listening on %s:%s with %s workers", args.host, args.port, workers)
+    try:
+        return _supervise(config, sock, workers)
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
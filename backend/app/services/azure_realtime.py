@@ -9,6 +9,7 @@ import aiohttp
 
 from app.config import settings
 from app.schemas.sessions import SessionConfig
+from app.services.log_pipeline import truncate
 
 logger = logging.getLogger(__name__)
 
@@ -52,16 +53,23 @@ class AzureRealtimeProvider:
             ) as response:
                 if response.status != 200:
                     text = await response.text()
-                    logger.error("Azure session mint failed: %s %s", response.status, text)
+                    logger.error(
+                        "Azure session mint failed: %s %s",
+                        response.status,
+                        truncate(text),
+                    )
                     raise RuntimeError(
-                        f"Azure session mint failed: {response.status} {text}"
+                        f"Azure session mint failed: {response.status} {truncate(text)}"
                     )
 
                 data = await response.json()
 
         ephemeral_key = data.get("client_secret", {}).get("value")
         if not ephemeral_key:
-            logger.error("Azure response missing 'client_secret.value'. Response: %s", data)
+            logger.error(
+                "Azure response missing 'client_secret.value'. Response: %s",
+                truncate(data),
+            )
             raise RuntimeError("Azure response missing client_secret.value")
 
         expires_at = datetime.now(UTC) + timedelta(seconds=60)
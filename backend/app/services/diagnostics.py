@@ -0,0 +1,216 @@
+"""Event-loop lag watchdog and on-demand stack/allocation profiling."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+import traceback
+from collections import Counter, deque
+from types import FrameType
+from typing import Any, Deque, Dict, List
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+LAG_WINDOW = 600
+MAX_STACK_CHARS = 4000
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LoopWatchdog:
+    """Measure event-loop lag and log a stack snapshot when the loop stalls.
+
+    A heartbeat coroutine records how late each periodic wake-up is. A daemon
+    thread watches the heartbeat; when it is older than the threshold the loop
+    is blocked by synchronous work, so the thread captures the loop thread's
+    current stack and logs it once per stall.
+    """
+
+    def __init__(self, interval_s: float, threshold_s: float) -> None:
+        self._interval_s = interval_s
+        self._threshold_s = threshold_s
+        self._lag: Deque[float] = deque(maxlen=LAG_WINDOW)
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._stalls = 0
+        self._max_stall_s = 0.0
+        self._last_stall_stack: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread:
+            self._thread.join(timeout=self._interval_s * 2)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        lag_ms = [sample * 1000 for sample in self._lag]
+        return {
+            "running": self.running,
+            "interval_ms": round(self._interval_s * 1000, 1),
+            "threshold_ms": round(self._threshold_s * 1000, 1),
+            "lag_ms": {
+                "p50": round(_percentile(lag_ms, 50), 2),
+                "p99": round(_percentile(lag_ms, 99), 2),
+                "max": round(max(lag_ms, default=0.0), 2),
+            },
+            "stalls": self._stalls,
+            "max_stall_ms": round(self._max_stall_s * 1000, 1),
+            "last_stall_stack": self._last_stall_stack,
+        }
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval_s
+            await asyncio.sleep(self._interval_s)
+            self._lag.append(max(0.0, loop.time() - expected))
+            self._last_beat = time.monotonic()
+
+    def _watch(self) -> None:
+        reported_beat: float | None = None
+        while not self._stop.wait(self._interval_s):
+            beat = self._last_beat
+            stalled_s = time.monotonic() - beat
+            if stalled_s < self._threshold_s:
+                continue
+            self._max_stall_s = max(self._max_stall_s, stalled_s)
+            if reported_beat == beat:
+                continue
+            reported_beat = beat
+            self._stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))[-MAX_STACK_CHARS:]
+            self._last_stall_stack = stack
+            logger.warning(
+                "Event loop blocked for %.0f ms; loop thread stack:\n%s",
+                stalled_s * 1000,
+                stack,
+            )
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_filename}:{code.co_name}:{frame.f_lineno}"
+
+
+def _sample_stacks(
+    thread_id: int, duration_s: float, interval_s: float
+) -> tuple[int, Counter[tuple[str, ...]]]:
+    stacks: Counter[tuple[str, ...]] = Counter()
+    samples = 0
+    deadline = time.monotonic() + duration_s
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            labels: List[str] = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            stacks[tuple(reversed(labels))] += 1
+            samples += 1
+        time.sleep(interval_s)
+    return samples, stacks
+
+
+async def capture_profile(
+    duration_s: float, interval_s: float, top: int
+) -> Dict[str, Any]:
+    """Sample the event-loop thread's stack and snapshot allocations.
+
+    Sampling runs in a worker thread so the loop keeps serving requests while
+    it is observed. ``tracemalloc`` is started for the window if it is not
+    already tracing, which slows allocations while the profile runs.
+    """
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        samples, stacks = await asyncio.to_thread(
+            _sample_stacks, threading.get_ident(), duration_s, interval_s
+        )
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    self_counts: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        self_counts[stack[-1]] += count
+
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+    )
+    allocations = [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_kib": round(stat.size / 1024, 1),
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+    return {
+        "duration_s": duration_s,
+        "interval_ms": round(interval_s * 1000, 2),
+        "samples": samples,
+        "tracemalloc_window_only": started_tracing,
+        "top_functions": [
+            {"frame": label, "samples": count}
+            for label, count in self_counts.most_common(top)
+        ],
+        "top_stacks": [
+            {"stack": ";".join(stack), "samples": count}
+            for stack, count in stacks.most_common(top)
+        ],
+        "top_allocations": allocations,
+    }
+
+
+loop_watchdog = LoopWatchdog(
+    interval_s=settings.loop_watchdog_interval_ms / 1000,
+    threshold_s=settings.loop_watchdog_threshold_ms / 1000,
+)
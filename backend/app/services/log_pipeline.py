@@ -0,0 +1,253 @@
+"""Non-blocking structured logging: records are queued on the event loop and
+formatted and written by a background thread."""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, List, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+
+MAX_TRACKED_MESSAGES = 10_000
+# Client libraries that log one INFO line per outbound request.
+QUIET_LOGGERS = ("httpx", "httpcore")
+
+_log_context: ContextVar[Dict[str, str]] = ContextVar("log_context", default={})
+
+
+def bind_log_context(**fields: str | None) -> None:
+    """Attach correlation fields (``session_id``, ``guidance_id``) to later records.
+
+    Context variables are copied into each asyncio task, so fields bound while
+    handling one request never leak into another. The flip side is that a
+    long-lived task created during a request keeps that request's fields for
+    good: start such tasks from the lifespan or with an empty
+    ``contextvars.Context()``.
+    """
+    context = dict(_log_context.get())
+    context.update({key: value for key, value in fields.items() if value})
+    _log_context.set(context)
+
+
+def current_log_context() -> Dict[str, str]:
+    return _log_context.get()
+
+
+@contextmanager
+def log_context(fields: Dict[str, str]) -> Iterator[None]:
+    """Replace the correlation fields for the duration of the block."""
+    token = _log_context.set(fields)
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class LogContextMiddleware:
+    """ASGI middleware giving each request a fresh correlation context."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        token = _log_context.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _log_context.reset(token)
+
+
+def truncate(value: object, limit: int | None = None) -> str:
+    """Render ``value`` for a log line, clipped to ``limit`` characters."""
+    limit = limit or settings.log_max_message_chars
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [{len(text) - limit} chars truncated]"
+
+
+@dataclass(slots=True)
+class _ErrorWindow:
+    started: float
+    emitted: int = 0
+    suppressed: int = 0
+
+
+class RepeatedErrorFilter(logging.Filter):
+    """Let the first ``burst`` warnings/errors of each message through per window.
+
+    Records are keyed by logger and unformatted message template, so an error
+    storm with varying arguments collapses to one key. The next record emitted
+    for a key reports how many were suppressed before it.
+    """
+
+    def __init__(self, burst: int, window_s: float) -> None:
+        super().__init__()
+        self._burst = burst
+        self._window_s = window_s
+        self._lock = threading.Lock()
+        self._windows: Dict[Tuple[str, int, str], _ErrorWindow] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            carried = 0
+            if window is None or now - window.started >= self._window_s:
+                carried = window.suppressed if window else 0
+                if len(self._windows) >= MAX_TRACKED_MESSAGES:
+                    self._windows.clear()
+                window = self._windows[key] = _ErrorWindow(started=now)
+            if window.emitted >= self._burst:
+                window.suppressed += 1
+                return False
+            window.emitted += 1
+        if carried:
+            record.suppressed = carried
+        return True
+
+
+class ContextQueueHandler(QueueHandler):
+    """Queue handler that captures correlation fields and never blocks.
+
+    ``prepare`` runs on the logging thread (the event loop), so it only
+    renders the message, clips it, and snapshots the context; JSON encoding
+    and I/O happen on the listener thread. A full queue drops the record.
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = truncate(record.getMessage())
+        record.args = None
+        if record.exc_info:
+            record.exc_text = truncate(
+                logging.Formatter().formatException(record.exc_info)
+            )
+            record.exc_info = None
+        record.context = _log_context.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        document: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "context", {}),
+        }
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            document["suppressed"] = suppressed
+        if record.exc_text:
+            document["exc"] = record.exc_text
+        return json.dumps(document, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self) -> None:
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = dict(getattr(record, "context", {}))
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            fields["suppressed"] = suppressed
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class LogPipeline:
+    """Route root logging through a bounded queue drained by a listener thread."""
+
+    def __init__(self) -> None:
+        self._handler: ContextQueueHandler | None = None
+        self._listener: QueueListener | None = None
+        self._previous: List[logging.Handler] = []
+        self._previous_level = logging.WARNING
+        self._quiet_levels: Dict[str, int] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._listener is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(settings.log_queue_size)
+        output = logging.StreamHandler(sys.stderr)
+        output.setFormatter(
+            JsonFormatter() if settings.log_format == "json" else TextFormatter()
+        )
+        self._handler = ContextQueueHandler(log_queue)
+        self._handler.addFilter(
+            RepeatedErrorFilter(
+                settings.log_error_burst, settings.log_error_window_seconds
+            )
+        )
+
+        root = logging.getLogger()
+        self._previous = list(root.handlers)
+        self._previous_level = root.level
+        for handler in self._previous:
+            root.removeHandler(handler)
+        root.addHandler(self._handler)
+        root.setLevel(settings.log_level.upper())
+        for name in QUIET_LOGGERS:
+            quiet = logging.getLogger(name)
+            self._quiet_levels[name] = quiet.level
+            quiet.setLevel(max(logging.WARNING, root.level))
+
+        self._listener = QueueListener(log_queue, output)
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Restore the previous handlers and drain the queue."""
+        if self._listener is None or self._handler is None:
+            return
+        root = logging.getLogger()
+        root.removeHandler(self._handler)
+        for handler in self._previous:
+            root.addHandler(handler)
+        root.setLevel(self._previous_level)
+        for name, level in self._quiet_levels.items():
+            logging.getLogger(name).setLevel(level)
+        self._listener.stop()
+        self._listener = None
+        if self._handler.dropped:
+            logging.getLogger(__name__).warning(
+                "Log queue full: dropped %s records", self._handler.dropped
+            )
+        self._handler = None
+
+
+log_pipeline = LogPipeline()
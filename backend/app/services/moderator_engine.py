@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Union
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Literal, Union
 
 from openai import AsyncAzureOpenAI, AsyncOpenAI
+from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,7 @@ from app.config import settings
 from app.schemas.moderator import (
     ChecklistKey,
     ModeratorGuidanceResponse,
+    StructuredGuidance,
     TranscriptSegment,
 )
 from app.services.prompt_builder import prompt_builder
@@ -35,6 +38,28 @@ NEGATIVE_WORDS = {
 }
 POSITIVE_WORDS = {"great", "good", "happy", "pleased", "love", "fantastic"}
 
+KeywordSet = Literal[
+    "greeting",
+    "rating",
+    "highlight",
+    "pain_point",
+    "suggestion",
+    "closing",
+    "negative",
+    "positive",
+]
+
+DEFAULT_KEYWORDS: Dict[KeywordSet, set[str]] = {
+    "greeting": GREETING_WORDS,
+    "rating": RATING_WORDS,
+    "highlight": HIGHLIGHT_WORDS,
+    "pain_point": PAIN_WORDS,
+    "suggestion": SUGGEST_WORDS,
+    "closing": CLOSING_WORDS,
+    "negative": NEGATIVE_WORDS,
+    "positive": POSITIVE_WORDS,
+}
+
 CHECKLIST_LABELS: Dict[ChecklistKey, str] = {
     "greeting": "Greeting & consent",
     "rating": "Satisfaction rating",
@@ -72,43 +97,137 @@ GUIDANCE_TEMPLATES: Dict[ChecklistKey, Dict[str, str]] = {
 }
 
 
+TEXT_MAX_COMPLETION_TOKENS = 900
+
+Route = Literal["fast", "strong"]
+
+STRUCTURED_GUIDANCE_SCHEMA: Dict[str, Any] = {
+    "name": "moderator_guidance",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "directive": {"type": "string"},
+            "target_item": {
+                "type": ["string", "null"],
+                "enum": [*CHECKLIST_LABELS, None],
+            },
+            "suggested_phrase": {"type": ["string", "null"]},
+        },
+        "required": ["directive", "target_item", "suggested_phrase"],
+        "additionalProperties": False,
+    },
+}
+
+
 @dataclass(slots=True)
 class ChecklistStatus:
     completed: List[ChecklistKey]
     missing: List[ChecklistKey]
 
 
+@dataclass(slots=True)
+class RouteDecision:
+    route: Route
+    model: str
+    reason: str
+
+
+@dataclass(slots=True)
+class CompletionStats:
+    """Running totals for moderator completions under one label."""
+
+    model: str = ""
+    calls: int = 0
+    latency_s: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    fallbacks: int = 0
+
+    def record(self, latency_s: float, usage: Any) -> None:
+        self.calls += 1
+        self.latency_s += latency_s
+        if usage is not None:
+            self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+            self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+
 class ModeratorEngine:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        model: str | None = None,
+        moderator_text: str | None = None,
+        output_mode: Literal["text", "structured"] | None = None,
+        keywords: Dict[str, Iterable[str]] | None = None,
+        client: Union[AsyncOpenAI, AsyncAzureOpenAI, None] = None,
+    ) -> None:
+        """Build the engine from settings; arguments override them for candidate configurations.
+
+        ``client`` reuses an existing API client instead of creating one,
+        ``model`` pins a single model (disabling fast/strong routing),
+        ``moderator_text`` replaces the body of ``moderator_instructions.md``,
+        and ``keywords`` replaces individual entries of ``DEFAULT_KEYWORDS``.
+        """
         bundle = prompt_builder.load_prompts()
         self._checklist = bundle.checklist
         self._moderator_instructions = bundle.moderator
+        self._structured_instructions = bundle.moderator_structured
+        if moderator_text is not None:
+            (
+                self._moderator_instructions,
+                self._structured_instructions,
+            ) = prompt_builder.compose_moderator(moderator_text)
         self._checklist_markdown = bundle.checklist_text
+        self._output_mode = output_mode or settings.moderator_output_mode
+        self._keywords: Dict[str, frozenset[str]] = {
+            name: frozenset(words) for name, words in DEFAULT_KEYWORDS.items()
+        }
+        for name, words in (keywords or {}).items():
+            if name not in DEFAULT_KEYWORDS:
+                raise ValueError(f"Unknown moderator keyword set: {name}")
+            self._keywords[name] = frozenset(word.lower() for word in words)
+        self._stats: Dict[str, CompletionStats] = {}
         self._client: Union[AsyncOpenAI, AsyncAzureOpenAI, None] = None
         self._model: str | None = None
+        self._fast_model: str | None = None
 
         # Initialize client based on provider
         if settings.provider == "openai" and settings.openai_api_key:
-            self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+            self._client = client or AsyncOpenAI(api_key=settings.openai_api_key)
             self._model = settings.openai_moderator_model
+            self._fast_model = settings.openai_moderator_fast_model
         elif (
             settings.provider == "azure"
             and settings.azure_openai_endpoint
             and settings.azure_openai_key
             and settings.azure_openai_moderator_deployment
         ):
-            self._client = AsyncAzureOpenAI(
+            self._client = client or AsyncAzureOpenAI(
                 azure_endpoint=settings.azure_openai_endpoint,
                 api_key=settings.azure_openai_key,
                 api_version=settings.azure_openai_api_version,
             )
             self._model = settings.azure_openai_moderator_deployment
+            self._fast_model = settings.azure_openai_moderator_fast_deployment
+
+        if self._client is None:
+            self._client = client
+        if model:
+            self._model = model
+            self._fast_model = None
 
     async def analyse(
-        self, transcript: Iterable[TranscriptSegment]
+        self,
+        transcript: Iterable[TranscriptSegment],
+        prior_completed: Iterable[ChecklistKey] = (),
     ) -> ModeratorGuidanceResponse:
+        """Analyse the transcript; ``prior_completed`` carries progress from earlier calls.
+
+        Items completed in an earlier call stay completed even when the
+        evidence has scrolled out of the (capped) transcript window.
+        """
         segments = list(transcript)
-        status = self._evaluate_checklist(segments)
+        status = self._evaluate_checklist(segments, prior_completed)
         tone = self._measure_tone(segments)
 
         guidance = await self._generate_llm_guidance(status, tone, segments)
@@ -121,19 +240,24 @@ class ModeratorEngine:
             next_poll_seconds=None,
         )
 
-    def _evaluate_checklist(self, segments: List[TranscriptSegment]) -> ChecklistStatus:
+    def _evaluate_checklist(
+        self,
+        segments: List[TranscriptSegment],
+        prior_completed: Iterable[ChecklistKey] = (),
+    ) -> ChecklistStatus:
         completed: List[ChecklistKey] = []
 
         def mark(item: ChecklistKey, predicate: Callable[[], bool]) -> None:
             if predicate() and item not in completed:
                 completed.append(item)
 
+        keywords = self._keywords
         lowered = [(seg.actor, seg.text.lower()) for seg in segments]
 
         mark(
             "greeting",
             lambda: any(
-                actor == "agent" and any(word in text for word in GREETING_WORDS)
+                actor == "agent" and any(word in text for word in keywords["greeting"])
                 for actor, text in lowered
             ),
         )
@@ -146,7 +270,7 @@ class ModeratorEngine:
                 for actor, text in lowered
             )
             or any(
-                actor == "agent" and any(word in text for word in RATING_WORDS)
+                actor == "agent" and any(word in text for word in keywords["rating"])
                 for actor, text in lowered
             ),
         )
@@ -154,25 +278,33 @@ class ModeratorEngine:
         mark(
             "highlight",
             lambda: any(
-                word in text for _, text in lowered for word in HIGHLIGHT_WORDS
+                word in text for _, text in lowered for word in keywords["highlight"]
             ),
         )
         mark(
             "pain_point",
-            lambda: any(word in text for _, text in lowered for word in PAIN_WORDS),
+            lambda: any(
+                word in text for _, text in lowered for word in keywords["pain_point"]
+            ),
         )
         mark(
             "suggestion",
-            lambda: any(word in text for _, text in lowered for word in SUGGEST_WORDS),
+            lambda: any(
+                word in text for _, text in lowered for word in keywords["suggestion"]
+            ),
         )
         mark(
             "closing",
             lambda: any(
-                actor == "agent" and any(word in text for word in CLOSING_WORDS)
+                actor == "agent" and any(word in text for word in keywords["closing"])
                 for actor, text in lowered
             ),
         )
 
+        for item in prior_completed:
+            if item not in completed:
+                completed.append(item)
+
         missing = [item for item in self._checklist if item not in completed]
         return ChecklistStatus(completed=completed, missing=missing)
 
@@ -194,6 +326,130 @@ class ModeratorEngine:
                 "Check your OPENAI_API_KEY or Azure OpenAI credentials."
             )
 
+        user_prompt = self._build_user_prompt(status, tone, segments)
+        decision = self._choose_route(status, tone)
+        structured = self._output_mode == "structured"
+        options: Dict[str, Any] = {
+            "max_completion_tokens": TEXT_MAX_COMPLETION_TOKENS,
+        }
+        system_prompt = self._moderator_instructions
+        if structured:
+            system_prompt = self._structured_instructions
+            options = {
+                "max_completion_tokens": settings.moderator_structured_max_tokens,
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": STRUCTURED_GUIDANCE_SCHEMA,
+                },
+            }
+
+        started = time.perf_counter()
+        try:
+            response = await self._client.chat.completions.create(
+                model=decision.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.2,
+                **options,
+            )
+        except Exception as exc:
+            logger.error(
+                "Moderator LLM call failed (route=%s, model=%s): %s",
+                decision.route,
+                decision.model,
+                exc,
+            )
+            raise
+
+        latency_s = time.perf_counter() - started
+        logger.debug(
+            "Moderator route=%s model=%s reason=%s latency_ms=%.0f",
+            decision.route,
+            decision.model,
+            decision.reason,
+            latency_s * 1000,
+        )
+        stats = self._stats.setdefault(
+            f"{self._output_mode}/{decision.route}",
+            CompletionStats(model=decision.model),
+        )
+        stats.record(latency_s, getattr(response, "usage", None))
+
+        content = (response.choices[0].message.content or "").strip()
+        if not structured:
+            return content
+
+        try:
+            parsed = StructuredGuidance.model_validate_json(content)
+        except ValidationError as exc:
+            logger.warning(
+                "Structured guidance invalid, using checklist template: %s",
+                exc.errors(include_url=False, include_input=False),
+            )
+            stats.fallbacks += 1
+            parsed = self._fallback_guidance(status)
+        return self._render_structured(parsed)
+
+    def _choose_route(self, status: ChecklistStatus, tone: str | None) -> RouteDecision:
+        """Send routine checklist progression to the fast model, the rest to the strong one."""
+        strong_model = self._model or ""
+        if not self._fast_model or self._fast_model == strong_model:
+            return RouteDecision("strong", strong_model, "routing_disabled")
+        if tone == "negative":
+            return RouteDecision("strong", strong_model, "negative_tone")
+        if len(status.missing) <= settings.moderator_route_closing_items:
+            return RouteDecision("strong", strong_model, "closing_summary")
+
+        last_completed = max(
+            (self._checklist.index(item) for item in status.completed), default=-1
+        )
+        gaps = sum(
+            1 for item in status.missing if self._checklist.index(item) < last_completed
+        )
+        if gaps >= settings.moderator_route_gap_threshold:
+            return RouteDecision("strong", strong_model, "ambiguous_checklist")
+        return RouteDecision("fast", self._fast_model, "checklist_progression")
+
+    def completion_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-label completion totals with average latency and tokens."""
+        report: Dict[str, Dict[str, Any]] = {}
+        for label, stats in self._stats.items():
+            calls = stats.calls or 1
+            report[label] = {
+                **asdict(stats),
+                "avg_latency_ms": round(stats.latency_s / calls * 1000, 1),
+                "avg_completion_tokens": round(stats.completion_tokens / calls, 1),
+            }
+        return report
+
+    def _fallback_guidance(self, status: ChecklistStatus) -> StructuredGuidance:
+        item: ChecklistKey = status.missing[0] if status.missing else "closing"
+        template = GUIDANCE_TEMPLATES[item]
+        return StructuredGuidance(
+            directive=template["coach"],
+            target_item=item,
+            suggested_phrase=template["prompt"],
+        )
+
+    def _render_structured(self, guidance: StructuredGuidance) -> str:
+        lines = [
+            "<MODERATOR_GUIDANCE>",
+            f"Checklist: {guidance.target_item or 'none'}",
+            f"Coach: {guidance.directive.strip()}",
+        ]
+        if guidance.suggested_phrase:
+            lines.append(f"Prompt: {guidance.suggested_phrase.strip()}")
+        lines.append("</MODERATOR_GUIDANCE>")
+        return "\n".join(lines)
+
+    def _build_user_prompt(
+        self,
+        status: ChecklistStatus,
+        tone: str | None,
+        segments: List[TranscriptSegment],
+    ) -> str:
         transcript_window = segments[-40:]
         transcript_text = "\n".join(
             f"{seg.timestamp} {seg.actor.upper()}: {seg.text}"
@@ -220,7 +476,7 @@ class ModeratorEngine:
                 f"Coach hint -> {priority_template['coach']} | Prompt idea -> {priority_template['prompt']}"
             )
 
-        user_prompt = "\n\n".join(
+        return "\n\n".join(
             [
                 "You receive the current survey transcript and checklist progress.",
                 "Checklist reference:\n" + self._checklist_markdown,
@@ -229,23 +485,6 @@ class ModeratorEngine:
             ]
         )
 
-        try:
-            response = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": self._moderator_instructions},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
-                max_completion_tokens=900,
-            )
-        except Exception as exc:
-            logger.error("Moderator LLM call failed: %s", exc)
-            raise
-
-        guidance = (response.choices[0].message.content or "").strip()
-        return guidance
-
     def _measure_tone(self, segments: List[TranscriptSegment]):
         recent_customer_lines = [
             seg.text.lower() for seg in segments if seg.actor == "customer"
@@ -253,11 +492,15 @@ class ModeratorEngine:
         if not recent_customer_lines:
             return None
         if any(
-            word in line for line in recent_customer_lines for word in NEGATIVE_WORDS
+            word in line
+            for line in recent_customer_lines
+            for word in self._keywords["negative"]
         ):
             return "negative"
         if any(
-            word in line for line in recent_customer_lines for word in POSITIVE_WORDS
+            word in line
+            for line in recent_customer_lines
+            for word in self._keywords["positive"]
         ):
             return "positive"
         return "neutral"
@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 
 from app.config import OPENAI_REALTIME_CLIENT_SECRETS_URL, settings
 from app.schemas.sessions import SessionConfig
+from app.services.log_pipeline import truncate
 
 
 class OpenAIRealtimeProvider:
@@ -56,7 +57,13 @@ class OpenAIRealtimeProvider:
             "session": session,
         }
 
-        logger.debug("OpenAI session config: %s", session_config)
+        logger.debug(
+            "OpenAI session config: model=%s voice=%s instructions=%s chars audio=%s",
+            config.model,
+            config.voice,
+            len(config.instructions),
+            truncate(audio_config),
+        )
 
         async with aiohttp.ClientSession() as client:
             async with client.post(
@@ -70,10 +77,12 @@ class OpenAIRealtimeProvider:
                 if response.status != 200:
                     text = await response.text()
                     logger.error(
-                        "OpenAI session mint failed: %s %s", response.status, text
+                        "OpenAI session mint failed: %s %s",
+                        response.status,
+                        truncate(text),
                     )
                     raise RuntimeError(
-                        f"OpenAI session mint failed: {response.status} {text}"
+                        f"OpenAI session mint failed: {response.status} {truncate(text)}"
                     )
 
                 data = await response.json()
@@ -81,7 +90,9 @@ class OpenAIRealtimeProvider:
         # Extract the ephemeral key (client secret) from the response
         ephemeral_key = data.get("value")
         if not ephemeral_key:
-            logger.error("OpenAI response missing 'value' field. Response: %s", data)
+            logger.error(
+                "OpenAI response missing 'value' field. Response: %s", truncate(data)
+            )
             raise RuntimeError("OpenAI response missing value")
 
         # Use expires_at from response, fallback to 60 seconds
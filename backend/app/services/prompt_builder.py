@@ -11,20 +11,35 @@ from app.config import settings
 
 PROMPT_DIR = Path(__file__).resolve().parent.parent / "prompts"
 
+SESSION_CLOSING_NOTE = (
+    "\n\nKeep your questions aligned with the checklist. Summarise the highlight, pain point,"
+    " and suggestion before closing with gratitude."
+)
+
 
 @dataclass(slots=True)
 class PromptBundle:
     persona: str
     checklist_text: str
     moderator: str
+    moderator_structured: str
+    structured_output: str
     checklist: List[ChecklistKey]
 
 
+def _compose_moderator(
+    moderator_text: str, checklist_text: str, structured_text: str
+) -> tuple[str, str]:
+    moderator = f"{moderator_text}\n\n---\n{checklist_text}"
+    return moderator, f"{moderator}\n\n---\n{structured_text}"
+
+
 class PromptBuilder:
     """Load markdown templates and build realtime instructions."""
 
     def __init__(self) -> None:
         self._bundle: PromptBundle | None = None
+        self._session_template: SessionConfig | None = None
 
     def load_prompts(self) -> PromptBundle:
         if self._bundle is not None:
@@ -41,10 +56,17 @@ class PromptBuilder:
             .read_text(encoding="utf-8")
             .strip()
         )
+        structured_text = (
+            (PROMPT_DIR / "moderator_structured_output.md")
+            .read_text(encoding="utf-8")
+            .strip()
+        )
 
         appended_checklist = f"\n\n---\n{checklist_text}"
         persona = f"{persona_text}{appended_checklist}"
-        moderator = f"{moderator_text}{appended_checklist}"
+        moderator, moderator_structured = _compose_moderator(
+            moderator_text, checklist_text, structured_text
+        )
 
         checklist: List[ChecklistKey] = [
             "greeting",
@@ -59,25 +81,25 @@ class PromptBuilder:
             persona=persona,
             checklist_text=checklist_text,
             moderator=moderator,
+            moderator_structured=moderator_structured,
+            structured_output=structured_text,
             checklist=checklist,
         )
         return self._bundle
 
-    def build_session_config(
-        self, participant_name: str | None = None
-    ) -> SessionConfig:
+    def compose_moderator(self, moderator_text: str) -> tuple[str, str]:
+        """Return (text, structured) system prompts for alternative moderator instructions."""
         bundle = self.load_prompts()
-        conversation_goal = bundle.persona
-        if participant_name:
-            conversation_goal += (
-                f"\n\nThe customer you are interviewing is named {participant_name}."
-            )
-
-        conversation_goal += (
-            "\n\nKeep your questions aligned with the checklist. Summarise the highlight, pain point,"
-            " and suggestion before closing with gratitude."
+        return _compose_moderator(
+            moderator_text.strip(), bundle.checklist_text, bundle.structured_output
         )
-        instructions = conversation_goal
+
+    def session_template(self) -> SessionConfig:
+        """Return the participant-independent session config, built once."""
+        if self._session_template is not None:
+            return self._session_template
+
+        bundle = self.load_prompts()
 
         if settings.provider == "azure":
             turn_detection = {
@@ -98,16 +120,32 @@ class PromptBuilder:
             "model": "whisper-1",
         }
 
-        return SessionConfig(
+        self._session_template = SessionConfig(
             model=settings.realtime_model,
             voice=settings.voice_name,
             provider=settings.provider,
-            instructions=instructions,
+            instructions=f"{bundle.persona}{SESSION_CLOSING_NOTE}",
             checklist=bundle.checklist,
             turn_detection=turn_detection,
             input_audio_transcription=input_audio_transcription,
             modalities=["text", "audio"],
         )
+        return self._session_template
+
+    def build_session_config(
+        self, participant_name: str | None = None
+    ) -> SessionConfig:
+        template = self.session_template()
+        if not participant_name:
+            return template.model_copy()
+
+        bundle = self.load_prompts()
+        instructions = (
+            f"{bundle.persona}"
+            f"\n\nThe customer you are interviewing is named {participant_name}."
+            f"{SESSION_CLOSING_NOTE}"
+        )
+        return template.model_copy(update={"instructions": instructions})
 
 
 prompt_builder = PromptBuilder()
@@ -0,0 +1,303 @@
+"""Session registry backends shared by the session and moderator endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, List, Protocol, Tuple
+
+from app.config import settings
+from app.schemas.moderator import ModeratorGuidanceResponse
+
+logger = logging.getLogger(__name__)
+
+
+class SessionState(Dict[str, object]): ...
+
+
+class SessionStore(Protocol):
+    async def save(self, state: SessionState) -> None:
+        """Insert or replace the record keyed by ``state["session_id"]``."""
+        ...
+
+    async def get(self, session_id: str) -> SessionState | None: ...
+
+    async def close(self) -> None:
+        """Flush pending writes before shutdown."""
+        ...
+
+
+GUIDANCE_PREVIEW_CHARS = 500
+
+
+def record_guidance(state: SessionState, guidance: ModeratorGuidanceResponse) -> None:
+    """Fold a moderator result into the session's checklist progress and history."""
+    checklist = state.get("checklist") or []
+    state["completed_items"] = [
+        item for item in checklist if item not in guidance.missing_items  # type: ignore[union-attr]
+    ]
+    history = list(state.get("guidance_history") or [])  # type: ignore[call-overload]
+    history.append(
+        {
+            "guidance_id": guidance.guidance_id,
+            "guidance_text": guidance.guidance_text[:GUIDANCE_PREVIEW_CHARS],
+            "tone_alert": guidance.tone_alert,
+            "at": time.time(),
+        }
+    )
+    state["guidance_history"] = history[-settings.session_guidance_history :]
+
+
+class MemorySessionStore:
+    """Per-process dict; sessions vanish on restart and are not shared by workers."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, SessionState] = {}
+
+    async def save(self, state: SessionState) -> None:
+        self._sessions[str(state["session_id"])] = state
+
+    async def get(self, session_id: str) -> SessionState | None:
+        return self._sessions.get(session_id)
+
+    async def close(self) -> None:
+        return None
+
+
+def _encode(state: SessionState) -> str:
+    def default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Unserialisable session value: {value!r}")
+
+    return json.dumps(state, default=default, separators=(",", ":"))
+
+
+def _decode(data: str) -> SessionState:
+    state = SessionState(json.loads(data))
+    created_at = state.get("created_at")
+    if isinstance(created_at, str):
+        state["created_at"] = datetime.fromisoformat(created_at)
+    return state
+
+
+def _row(state: SessionState) -> Tuple[str, str, str]:
+    created_at = state.get("created_at")
+    return (
+        str(state["session_id"]),
+        created_at.isoformat() if isinstance(created_at, datetime) else "",
+        _encode(state),
+    )
+
+
+class SqliteSessionStore:
+    """SQLite file in WAL mode, safe to share between worker processes.
+
+    Queries run in the default thread pool with one connection per thread, so
+    the event loop never waits on disk. Connections are opened lazily, which
+    keeps the store fork-safe when workers are pre-forked after import.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, created_at TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+            self._local.connection = connection
+        return connection
+
+    def _write_rows(self, rows: List[Tuple[str, str, str]]) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            connection.executemany(
+                "INSERT OR REPLACE INTO sessions (session_id, created_at, data) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def _get(self, session_id: str) -> SessionState | None:
+        row = (
+            self._connection()
+            .execute("SELECT data FROM sessions WHERE session_id = ?", (session_id,))
+            .fetchone()
+        )
+        return _decode(row[0]) if row else None
+
+    async def save(self, state: SessionState) -> None:
+        await asyncio.to_thread(self._write_rows, [_row(state)])
+
+    async def get(self, session_id: str) -> SessionState | None:
+        return await asyncio.to_thread(self._get, session_id)
+
+    async def close(self) -> None:
+        return None
+
+
+class WriteBehindSessionStore(SqliteSessionStore):
+    """In-memory registry that persists to SQLite in batches off the request path.
+
+    ``save`` only updates the cache and marks the record dirty; a background
+    task writes dirty records in one transaction every flush interval (or
+    sooner once a batch fills up). Nothing is loaded at startup: a cache miss
+    reads that single session from disk, so restarts stay fast and sessions
+    rehydrate as their next request arrives. The cache is per process, so use
+    ``SqliteSessionStore`` when several workers serve the same sessions.
+
+    The cache is an LRU capped at ``cache_size`` records. Only records that
+    are neither dirty nor part of the batch being written are evicted, since
+    only those are guaranteed to be readable from disk.
+    """
+
+    def __init__(
+        self, path: Path, flush_interval_s: float, batch_size: int, cache_size: int
+    ) -> None:
+        super().__init__(path)
+        self._flush_interval_s = flush_interval_s
+        self._batch_size = batch_size
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, SessionState] = OrderedDict()
+        self._dirty: Dict[str, SessionState] = {}
+        self._flushing: Dict[str, SessionState] = {}
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def save(self, state: SessionState) -> None:
+        session_id = str(state["session_id"])
+        self._cache[session_id] = state
+        self._cache.move_to_end(session_id)
+        # Shallow copy: callers keep mutating the cached record while the
+        # flush thread encodes this one.
+        self._dirty[session_id] = SessionState(state)
+        if self._flusher is None or self._flusher.done():
+            self._stopping = False
+            # Empty context: the flusher outlives the request that started it
+            # and must not carry its log correlation fields.
+            self._flusher = asyncio.create_task(
+                self._flush_loop(), context=contextvars.Context()
+            )
+        if len(self._dirty) >= self._batch_size:
+            self._wake.set()
+        self._evict()
+
+    async def get(self, session_id: str) -> SessionState | None:
+        state = self._cache.get(session_id)
+        if state is not None:
+            self._cache.move_to_end(session_id)
+            return state
+        state = await super().get(session_id)
+        if state is not None:
+            state = self._cache.setdefault(session_id, state)
+            self._evict()
+        return state
+
+    async def close(self) -> None:
+        # Let an in-flight flush finish (and re-queue on failure) rather than
+        # cancelling it: its thread would keep writing after the final flush.
+        if self._flusher is not None:
+            self._stopping = True
+            self._wake.set()
+            await self._flusher
+            self._flusher = None
+        await self._flush()
+        if self._dirty:
+            logger.error(
+                "Write-behind store closed with %s unsaved sessions", len(self._dirty)
+            )
+
+    def _evict(self) -> None:
+        """Drop least recently used clean records until the cache fits."""
+        excess = len(self._cache) - self._cache_size
+        if excess <= 0:
+            return
+        for session_id in list(self._cache):
+            if excess <= 0:
+                break
+            if session_id not in self._dirty and session_id not in self._flushing:
+                del self._cache[session_id]
+                excess -= 1
+
+    async def _flush_loop(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._flush_interval_s)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self._flush()
+            except Exception:
+                # Keep flushing later batches.
+                logger.exception("Session write-behind flush crashed")
+
+    def _write_batch(self, batch: List[SessionState]) -> None:
+        rows = []
+        for state in batch:
+            try:
+                rows.append(_row(state))
+            except (TypeError, ValueError) as exc:
+                # Retrying cannot fix an unserialisable record; drop only it.
+                logger.error(
+                    "Dropping unserialisable session %s: %s",
+                    state.get("session_id"),
+                    exc,
+                )
+        if rows:
+            self._write_rows(rows)
+
+    async def _flush(self) -> None:
+        if not self._dirty:
+            return
+        self._flushing, self._dirty = self._dirty, {}
+        batch = list(self._flushing.values())
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+        except Exception as exc:
+            # Retried on the next flush.
+            logger.error(
+                "Session write-behind flush failed (%s records): %s", len(batch), exc
+            )
+            # Keep newer writes that arrived during the flush.
+            for session_id, state in self._flushing.items():
+                self._dirty.setdefault(session_id, state)
+            return
+        finally:
+            self._flushing = {}
+        self._evict()
+
+
+@lru_cache(maxsize=1)
+def get_session_store() -> SessionStore:
+    if settings.session_store == "sqlite":
+        logger.info("Using SQLite session store at %s", settings.session_store_path)
+        return SqliteSessionStore(settings.session_store_path)
+    if settings.session_store == "write_behind":
+        logger.info(
+            "Using write-behind session store at %s", settings.session_store_path
+        )
+        return WriteBehindSessionStore(
+            settings.session_store_path,
+            flush_interval_s=settings.session_flush_interval_ms / 1000,
+            batch_size=settings.session_flush_batch_size,
+            cache_size=settings.session_cache_size,
+        )
+    return MemorySessionStore()
@@ -0,0 +1,229 @@
+"""Shadow evaluation of a candidate moderator configuration off the hot path."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List
+
+from app.config import settings
+from app.schemas.moderator import ModeratorGuidanceResponse, TranscriptSegment
+from app.schemas.sessions import ChecklistKey
+from app.services.log_pipeline import current_log_context, log_context
+from app.services.moderator_engine import ModeratorEngine, moderator_engine
+
+logger = logging.getLogger(__name__)
+
+RECENT_COMPARISONS = 50
+
+
+@dataclass(slots=True)
+class ShadowJob:
+    segments: List[TranscriptSegment]
+    prior_completed: List[ChecklistKey]
+    primary: ModeratorGuidanceResponse
+    primary_latency_s: float
+    log_fields: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ShadowComparison:
+    guidance_id: str
+    primary_latency_ms: float
+    candidate_latency_ms: float
+    missing_only_primary: List[str]
+    missing_only_candidate: List[str]
+    primary_tone: str | None
+    candidate_tone: str | None
+    guidance_length_delta: int
+
+
+@dataclass(slots=True)
+class ShadowTotals:
+    sampled: int = 0
+    dropped: int = 0
+    completed: int = 0
+    failed: int = 0
+    primary_latency_s: float = 0.0
+    candidate_latency_s: float = 0.0
+    missing_items_mismatches: int = 0
+    tone_mismatches: int = 0
+    guidance_length_delta: int = 0
+
+
+class ShadowEvaluator:
+    """Replay sampled guidance calls against a candidate engine in the background.
+
+    Jobs go through a bounded queue; when it is full the job is dropped rather
+    than waiting, so the primary request path never blocks on shadow work.
+    The candidate engine is built by ``start`` at application startup; if its
+    configuration is invalid, shadowing is disabled instead of failing later
+    in request background tasks.
+    """
+
+    def __init__(self) -> None:
+        self._sample_rate = settings.moderator_shadow_sample_rate
+        self._candidate: ModeratorEngine | None = None
+        self._queue: asyncio.Queue[ShadowJob] | None = None
+        self._workers: List[asyncio.Task[None]] = []
+        self._totals = ShadowTotals()
+        self._recent: Deque[ShadowComparison] = deque(maxlen=RECENT_COMPARISONS)
+        self._startup_error: str | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._sample_rate > 0
+
+    def should_sample(self) -> bool:
+        return (
+            self.enabled
+            and self._queue is not None
+            and random.random() < self._sample_rate
+        )
+
+    def start(self) -> None:
+        """Build the candidate engine and start the workers (called from the lifespan)."""
+        if not self.enabled or self._queue is not None:
+            return
+        try:
+            candidate = self._build_candidate()
+            if not candidate._client or not candidate._model:
+                raise RuntimeError("candidate moderator client or model not configured")
+            self._candidate = candidate
+        except Exception as exc:
+            # A bad candidate disables shadowing; it must not break the app.
+            self._startup_error = f"{type(exc).__name__}: {exc}"
+            self._sample_rate = 0.0
+            logger.error("Shadow moderator disabled, invalid candidate: %s", exc)
+            return
+        self._queue = asyncio.Queue(maxsize=settings.moderator_shadow_queue_size)
+        self._workers = [
+            asyncio.create_task(self._run_worker())
+            for _ in range(settings.moderator_shadow_workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    async def submit(
+        self,
+        segments: List[TranscriptSegment],
+        prior_completed: List[ChecklistKey],
+        primary: ModeratorGuidanceResponse,
+        primary_latency_s: float,
+    ) -> None:
+        """Enqueue a comparison; meant to run as a response background task."""
+        if self._queue is None:
+            return
+        self._totals.sampled += 1
+        try:
+            self._queue.put_nowait(
+                ShadowJob(
+                    segments,
+                    prior_completed,
+                    primary,
+                    primary_latency_s,
+                    current_log_context(),
+                )
+            )
+        except asyncio.QueueFull:
+            self._totals.dropped += 1
+
+    def report(self) -> Dict[str, Any]:
+        totals = self._totals
+        completed = totals.completed or 1
+        candidate = self._candidate
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self._sample_rate,
+            "startup_error": self._startup_error,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            **asdict(totals),
+            "avg_primary_latency_ms": round(
+                totals.primary_latency_s / completed * 1000, 1
+            ),
+            "avg_candidate_latency_ms": round(
+                totals.candidate_latency_s / completed * 1000, 1
+            ),
+            "avg_guidance_length_delta": round(
+                totals.guidance_length_delta / completed, 1
+            ),
+            "primary_completions": moderator_engine.completion_stats(),
+            "candidate_completions": candidate.completion_stats() if candidate else {},
+            "recent": [asdict(item) for item in self._recent],
+        }
+
+    def _build_candidate(self) -> ModeratorEngine:
+        instructions_path = settings.moderator_shadow_instructions
+        moderator_text = (
+            instructions_path.read_text(encoding="utf-8") if instructions_path else None
+        )
+        return ModeratorEngine(
+            model=settings.moderator_shadow_model,
+            moderator_text=moderator_text,
+            output_mode=settings.moderator_shadow_output_mode,
+            keywords=settings.moderator_shadow_keywords,
+            client=moderator_engine._client,
+        )
+
+    async def _run_worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            job = await self._queue.get()
+            # Tag this job's logs with the request it shadows.
+            with log_context(job.log_fields):
+                try:
+                    await self._evaluate(job)
+                except Exception as exc:
+                    # Shadow work must never escape into the primary path.
+                    self._totals.failed += 1
+                    logger.warning("Shadow moderator evaluation failed: %s", exc)
+                finally:
+                    self._queue.task_done()
+
+    async def _evaluate(self, job: ShadowJob) -> None:
+        assert self._candidate is not None
+        started = time.perf_counter()
+        candidate = await self._candidate.analyse(job.segments, job.prior_completed)
+        candidate_latency_s = time.perf_counter() - started
+
+        primary = job.primary
+        only_primary = sorted(set(primary.missing_items) - set(candidate.missing_items))
+        only_candidate = sorted(
+            set(candidate.missing_items) - set(primary.missing_items)
+        )
+        length_delta = len(candidate.guidance_text) - len(primary.guidance_text)
+
+        totals = self._totals
+        totals.completed += 1
+        totals.primary_latency_s += job.primary_latency_s
+        totals.candidate_latency_s += candidate_latency_s
+        totals.guidance_length_delta += length_delta
+        if only_primary or only_candidate:
+            totals.missing_items_mismatches += 1
+        if primary.tone_alert != candidate.tone_alert:
+            totals.tone_mismatches += 1
+
+        self._recent.append(
+            ShadowComparison(
+                guidance_id=primary.guidance_id,
+                primary_latency_ms=round(job.primary_latency_s * 1000, 1),
+                candidate_latency_ms=round(candidate_latency_s * 1000, 1),
+                missing_only_primary=only_primary,
+                missing_only_candidate=only_candidate,
+                primary_tone=primary.tone_alert,
+                candidate_tone=candidate.tone_alert,
+                guidance_length_delta=length_delta,
+            )
+        )
+
+
+shadow_evaluator = ShadowEvaluator()
@@ -0,0 +1,154 @@
+"""Aggregate live view of every session's checklist progress for supervisors."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List
+
+from app.config import settings
+from app.schemas.moderator import ModeratorGuidanceResponse
+
+GUIDANCE_PREVIEW_CHARS = 500
+
+
+@dataclass(slots=True)
+class SessionProgress:
+    session_id: str
+    guidance_id: str
+    missing_items: List[str]
+    tone_alert: str | None
+    guidance_preview: str
+    updated_at: float
+    changed: List[str] = field(default_factory=list)
+
+    def as_event(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "guidance_id": self.guidance_id,
+            "missing_items": self.missing_items,
+            "tone_alert": self.tone_alert,
+            "guidance_preview": self.guidance_preview,
+            "updated_at": self.updated_at,
+            "changed": self.changed,
+        }
+
+
+class Subscription:
+    """Coalescing mailbox: holds at most the latest update per session.
+
+    A slow consumer only ever sees the newest state of each session, so the
+    publisher never waits on it. If more sessions change between reads than
+    ``max_pending`` allows, the mailbox is cleared and the consumer is asked
+    to resync from a full snapshot instead.
+    """
+
+    def __init__(self, max_pending: int) -> None:
+        self._max_pending = max_pending
+        self._pending: Dict[str, SessionProgress] = {}
+        self._ready = asyncio.Event()
+        self.needs_snapshot = True
+
+    def offer(self, progress: SessionProgress) -> None:
+        if self.needs_snapshot:
+            self._ready.set()
+            return
+        pending = self._pending.pop(progress.session_id, None)
+        if pending is not None:
+            # Keep what changed since the subscriber's last read, not just
+            # since the previous publish.
+            progress = replace(
+                progress,
+                changed=[
+                    *progress.changed,
+                    *(item for item in pending.changed if item not in progress.changed),
+                ],
+            )
+        self._pending[progress.session_id] = progress
+        if len(self._pending) > self._max_pending:
+            self._pending.clear()
+            self.needs_snapshot = True
+        self._ready.set()
+
+    async def wait(self, timeout_s: float) -> bool:
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout_s)
+        except TimeoutError:
+            return False
+        return True
+
+    def drain(self) -> List[SessionProgress]:
+        self._ready.clear()
+        updates = list(self._pending.values())
+        self._pending.clear()
+        return updates
+
+
+class SupervisorFeed:
+    def __init__(self) -> None:
+        self._sessions: Dict[str, SessionProgress] = {}
+        self._subscribers: set[Subscription] = set()
+
+    @property
+    def full(self) -> bool:
+        return len(self._subscribers) >= settings.supervisor_max_subscribers
+
+    def publish(self, session_id: str, guidance: ModeratorGuidanceResponse) -> None:
+        """Record the moderator's latest output and fan out what changed."""
+        now = time.time()
+        previous = self._sessions.get(session_id)
+        changed: List[str] = []
+        if previous is None or previous.missing_items != guidance.missing_items:
+            changed.append("checklist")
+        if previous is None or previous.tone_alert != guidance.tone_alert:
+            changed.append("tone")
+        if previous is None or previous.guidance_id != guidance.guidance_id:
+            changed.append("guidance")
+        if not changed:
+            # Still active: refresh and move to the end so eviction stays ordered.
+            del self._sessions[session_id]
+            previous.updated_at = now
+            self._sessions[session_id] = previous
+            return
+
+        progress = SessionProgress(
+            session_id=session_id,
+            guidance_id=guidance.guidance_id,
+            missing_items=list(guidance.missing_items),
+            tone_alert=guidance.tone_alert,
+            guidance_preview=guidance.guidance_text[:GUIDANCE_PREVIEW_CHARS],
+            updated_at=now,
+            changed=changed,
+        )
+        # Re-insert so iteration order stays oldest-first for eviction.
+        self._sessions.pop(session_id, None)
+        self._sessions[session_id] = progress
+        self._evict_stale(now)
+        for subscriber in self._subscribers:
+            subscriber.offer(progress)
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(settings.supervisor_max_pending)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def snapshot(self, subscription: Subscription) -> List[Dict[str, Any]]:
+        subscription.needs_snapshot = False
+        subscription.drain()
+        self._evict_stale(time.time())
+        return [progress.as_event() for progress in self._sessions.values()]
+
+    def _evict_stale(self, now: float) -> None:
+        cutoff = now - settings.supervisor_session_ttl_seconds
+        while self._sessions:
+            session_id, progress = next(iter(self._sessions.items()))
+            if progress.updated_at >= cutoff:
+                break
+            del self._sessions[session_id]
+
+
+supervisor_feed = SupervisorFeed()
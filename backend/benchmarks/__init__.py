@@ -0,0 +1,4 @@
+"""Benchmark tooling for the bootstrap backend.
+
+Run modules from the ``backend/`` directory, e.g. ``python -m benchmarks.load_replay``.
+"""
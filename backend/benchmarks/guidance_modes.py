@@ -0,0 +1,110 @@
+"""Compare completion latency and token usage across moderator output modes.
+
+Calls the configured moderator model (``OPENAI_API_KEY`` or the Azure
+settings in ``.env``) with the same transcripts in ``text`` and ``structured``
+mode (mid-call transcripts with open checklist items plus the 10/100/400-segment
+ones) and reports latency percentiles, completion tokens, and structured-output
+fallbacks per mode, followed by the engine's per-route totals when a fast
+moderator model is configured. Pass ``--stub`` to exercise the code path without
+credentials (token counts are then synthetic).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.guidance_modes --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Dict, List
+
+from app.services.moderator_engine import moderator_engine
+from benchmarks.load_replay import percentile
+from benchmarks.transcripts import (
+    PARTIAL_SEGMENT_COUNTS,
+    SEGMENT_COUNTS,
+    synthetic_segments,
+)
+
+MODES = ("text", "structured")
+
+
+async def run_modes(rounds: int) -> Dict[str, Dict[str, float]]:
+    transcripts = [
+        synthetic_segments(count)
+        for count in PARTIAL_SEGMENT_COUNTS + SEGMENT_COUNTS
+    ]
+    report: Dict[str, Dict[str, float]] = {}
+    for mode in MODES:
+        moderator_engine._output_mode = mode
+        latencies: List[float] = []
+        lengths: List[int] = []
+        for _ in range(rounds):
+            for segments in transcripts:
+                started = time.perf_counter()
+                guidance = await moderator_engine.analyse(segments)
+                latencies.append(time.perf_counter() - started)
+                lengths.append(len(guidance.guidance_text))
+        routes = [
+            stats
+            for label, stats in moderator_engine.completion_stats().items()
+            if label.startswith(f"{mode}/")
+        ]
+        calls = sum(stats["calls"] for stats in routes)
+        report[mode] = {
+            "calls": calls,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+            "avg_completion_tokens": round(
+                sum(stats["completion_tokens"] for stats in routes) / (calls or 1), 1
+            ),
+            "avg_guidance_chars": round(sum(lengths) / len(lengths), 1),
+            "fallbacks": sum(stats["fallbacks"] for stats in routes),
+        }
+    return report
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the 2/4/6 and 10/100/400-segment transcripts.")
+    parser.add_argument("--stub", action="store_true", help="Use the stub LLM client instead of the configured model.")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Stub latency when --stub is set.")
+    args = parser.parse_args(argv)
+
+    if args.stub:
+        from benchmarks.stubs import install_stubs
+
+        install_stubs(llm_latency_s=args.llm_latency_ms / 1000)
+
+    try:
+        report = asyncio.run(run_modes(args.rounds))
+    except RuntimeError as exc:
+        print(f"Moderator unavailable: {exc}", file=sys.stderr)
+        return 1
+
+    print(
+        f"{'mode':<11} {'calls':>6} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'compl tok':>10} {'chars':>8} {'fallback':>9}"
+    )
+    for mode, row in report.items():
+        print(
+            f"{mode:<11} {row['calls']:>6} {row['p50_ms']:>9} {row['p95_ms']:>9} "
+            f"{row['avg_completion_tokens']:>10} {row['avg_guidance_chars']:>8} "
+            f"{row['fallbacks']:>9}"
+        )
+
+    print(f"\n{'route':<18} {'model':<24} {'calls':>6} {'avg ms':>8} {'prompt tok':>11} {'compl tok':>10}")
+    for label, stats in moderator_engine.completion_stats().items():
+        print(
+            f"{label:<18} {stats['model']:<24} {stats['calls']:>6} "
+            f"{stats['avg_latency_ms']:>8} {stats['prompt_tokens']:>11} "
+            f"{stats['completion_tokens']:>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
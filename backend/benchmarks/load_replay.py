@@ -0,0 +1,371 @@
+"""Concurrent-session load replay against the session and guidance endpoints.
+
+Each simulated caller mirrors the frontend ``ModeratorOrchestrator``:
+
+- ``POST /api/sessions`` once, then replay a transcript segment by segment.
+- Agent turns start ``POST_SPEECH_DELAY_S`` after the customer stops speaking.
+- Guidance polls start after ``FIRST_POLL_DELAY_S`` and repeat every
+  ``POLL_INTERVAL_S`` (or ``next_poll_seconds``), with at most one request in
+  flight and the payload capped at the last ``MAX_SEGMENTS`` segments.
+
+By default the app runs in-process with the moderator LLM and provider minting
+replaced by latency-configurable stubs. Pass ``--base-url`` to drive a running
+server instead (its own configuration decides what sits behind it).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.load_replay --sessions 200 --ramp 30 --duration 120 --speed 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import resource
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncContextManager, Dict, List
+
+import httpx
+
+from benchmarks.transcripts import load_recorded, synthetic_transcript
+
+MAX_SEGMENTS = 400
+POLL_INTERVAL_S = 5.0
+FIRST_POLL_DELAY_S = 1.5
+POST_SPEECH_DELAY_S = 0.25
+SEGMENT_SPEECH_S = 3.0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; ``nan`` for an empty sample."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is the peak (KiB on Linux, bytes on macOS), not current RSS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed_s: float) -> Dict[str, float]:
+        total = len(self.latencies) + self.errors
+        return {
+            "requests": total,
+            "errors": self.errors,
+            "throughput_rps": round(total / elapsed_s, 2) if elapsed_s else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 2),
+        }
+
+
+class LoopLagMonitor:
+    """Measure how late a periodic ``asyncio.sleep`` wakes up."""
+
+    def __init__(self, interval_s: float = 0.05) -> None:
+        self._interval_s = interval_s
+        self.samples: List[float] = []
+        self.rss_samples: List[int] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        ticks = 0
+        while True:
+            expected = loop.time() + self._interval_s
+            await asyncio.sleep(self._interval_s)
+            self.samples.append(max(0.0, loop.time() - expected))
+            ticks += 1
+            if ticks % 20 == 0:
+                self.rss_samples.append(current_rss_bytes())
+
+
+@dataclass(slots=True)
+class ReplayConfig:
+    sessions: int
+    ramp_s: float
+    duration_s: float
+    speed: float
+    transcripts: List[List[Dict[str, str]]]
+
+
+class SessionReplayer:
+    def __init__(self, client: httpx.AsyncClient, config: ReplayConfig) -> None:
+        self._client = client
+        self._config = config
+        self.stats: Dict[str, EndpointStats] = {
+            "sessions": EndpointStats(),
+            "guidance": EndpointStats(),
+        }
+        self.active = 0
+        self.peak_active = 0
+        self.completed_sessions = 0
+
+    def _scaled(self, seconds: float) -> float:
+        return seconds / self._config.speed
+
+    async def _post(self, name: str, path: str, body: dict) -> dict | None:
+        started = time.perf_counter()
+        try:
+            response = await self._client.post(path, json=body)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            self.stats[name].errors += 1
+            return None
+        self.stats[name].latencies.append(time.perf_counter() - started)
+        return response.json()
+
+    async def run(self, deadline: float) -> None:
+        offsets = [
+            self._config.ramp_s * index / self._config.sessions
+            for index in range(self._config.sessions)
+        ]
+        await asyncio.gather(
+            *(self._worker(index, offset, deadline) for index, offset in enumerate(offsets))
+        )
+
+    async def _worker(self, index: int, offset_s: float, deadline: float) -> None:
+        await asyncio.sleep(offset_s)
+        transcripts = self._config.transcripts
+        iteration = 0
+        while time.perf_counter() < deadline:
+            transcript = transcripts[(index + iteration) % len(transcripts)]
+            iteration += 1
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            try:
+                await self._replay_session(index, transcript, deadline)
+            finally:
+                self.active -= 1
+
+    async def _replay_session(
+        self, index: int, transcript: List[Dict[str, str]], deadline: float
+    ) -> None:
+        session = await self._post(
+            "sessions", "/api/sessions", {"participant_name": f"Caller {index}"}
+        )
+        if session is None:
+            await asyncio.sleep(self._scaled(POLL_INTERVAL_S))
+            return
+
+        buffer: List[Dict[str, str]] = []
+        speaking_done = asyncio.Event()
+        poller = asyncio.create_task(
+            self._poll_guidance(session["session_id"], buffer, speaking_done, deadline)
+        )
+        try:
+            previous_actor: str | None = None
+            for segment in transcript:
+                if time.perf_counter() >= deadline:
+                    break
+                if previous_actor == "customer" and segment["actor"] == "agent":
+                    await asyncio.sleep(self._scaled(POST_SPEECH_DELAY_S))
+                await asyncio.sleep(self._scaled(SEGMENT_SPEECH_S))
+                buffer.append(segment)
+                previous_actor = segment["actor"]
+            else:
+                self.completed_sessions += 1
+            speaking_done.set()
+            await poller
+        finally:
+            poller.cancel()
+
+    async def _poll_guidance(
+        self,
+        session_id: str,
+        buffer: List[Dict[str, str]],
+        speaking_done: asyncio.Event,
+        deadline: float,
+    ) -> None:
+        delay = FIRST_POLL_DELAY_S
+        while not speaking_done.is_set() and time.perf_counter() < deadline:
+            try:
+                await asyncio.wait_for(speaking_done.wait(), self._scaled(delay))
+                return
+            except TimeoutError:
+                pass
+            delay = POLL_INTERVAL_S
+            if not buffer:
+                continue
+            guidance = await self._post(
+                "guidance",
+                "/api/moderator/guidance",
+                {"session_id": session_id, "transcript": buffer[-MAX_SEGMENTS:]},
+            )
+            if guidance and guidance.get("next_poll_seconds"):
+                delay = float(guidance["next_poll_seconds"])
+
+
+async def run_replay(args: argparse.Namespace) -> Dict[str, object]:
+    if args.transcripts:
+        transcripts = load_recorded(Path(args.transcripts))
+    else:
+        transcripts = [synthetic_transcript(args.segments)]
+
+    config = ReplayConfig(
+        sessions=args.sessions,
+        ramp_s=args.ramp,
+        duration_s=args.duration,
+        speed=args.speed,
+        transcripts=transcripts,
+    )
+
+    if args.base_url:
+        transport = None
+        base_url = args.base_url
+        lifespan: AsyncContextManager[object] = contextlib.nullcontext()
+    else:
+        from app.config import settings
+        from benchmarks.stubs import install_stubs
+
+        # Read by the log pipeline when the lifespan starts.
+        settings.log_level = args.log_level
+        install_stubs(
+            llm_latency_s=args.llm_latency_ms / 1000,
+            mint_latency_s=args.mint_latency_ms / 1000,
+        )
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://load-replay"
+        # ASGITransport does not run the lifespan; startup wires shadow workers.
+        lifespan = app.router.lifespan_context(app)
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    rss_start = current_rss_bytes()
+    monitor = LoopLagMonitor()
+    async with lifespan, httpx.AsyncClient(
+        transport=transport, base_url=base_url, limits=limits, timeout=30.0
+    ) as client:
+        replayer = SessionReplayer(client, config)
+        monitor.start()
+        started = time.perf_counter()
+        await replayer.run(deadline=started + config.duration_s)
+        elapsed = time.perf_counter() - started
+        await monitor.stop()
+    rss_end = current_rss_bytes()
+
+    lag_ms = [sample * 1000 for sample in monitor.samples]
+    rss_peak = max([rss_start, rss_end, *monitor.rss_samples])
+    return {
+        "target": base_url,
+        "sessions": config.sessions,
+        "peak_concurrent_sessions": replayer.peak_active,
+        "completed_sessions": replayer.completed_sessions,
+        "elapsed_s": round(elapsed, 2),
+        "endpoints": {
+            name: stats.summary(elapsed) for name, stats in replayer.stats.items()
+        },
+        "event_loop_lag_ms": {
+            "p50": round(percentile(lag_ms, 50), 2),
+            "p99": round(percentile(lag_ms, 99), 2),
+            "max": round(max(lag_ms, default=math.nan), 2),
+        },
+        "rss_mib": {
+            "start": round(rss_start / 2**20, 1),
+            "peak": round(rss_peak / 2**20, 1),
+            "end": round(rss_end / 2**20, 1),
+            "growth": round((rss_end - rss_start) / 2**20, 1),
+        },
+    }
+
+
+def format_report(report: Dict[str, object]) -> str:
+    lines = [
+        f"target={report['target']} sessions={report['sessions']} "
+        f"peak_concurrent={report['peak_concurrent_sessions']} "
+        f"completed={report['completed_sessions']} elapsed={report['elapsed_s']}s",
+        f"{'endpoint':<10} {'requests':>9} {'errors':>7} {'rps':>8} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+    ]
+    for name, summary in report["endpoints"].items():  # type: ignore[union-attr]
+        lines.append(
+            f"{name:<10} {summary['requests']:>9} {summary['errors']:>7} "
+            f"{summary['throughput_rps']:>8} {summary['p50_ms']:>9} "
+            f"{summary['p95_ms']:>9} {summary['p99_ms']:>9}"
+        )
+    lag = report["event_loop_lag_ms"]
+    rss = report["rss_mib"]
+    lines.append(
+        f"event loop lag ms: p50={lag['p50']} p99={lag['p99']} max={lag['max']}"  # type: ignore[index]
+    )
+    lines.append(
+        f"rss MiB: start={rss['start']} peak={rss['peak']} end={rss['end']} "  # type: ignore[index]
+        f"growth={rss['growth']}"  # type: ignore[index]
+    )
+    return "\n".join(lines)
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50, help="Concurrent sessions to ramp up to.")
+    parser.add_argument("--ramp", type=float, default=10.0, help="Seconds to reach full concurrency.")
+    parser.add_argument("--duration", type=float, default=60.0, help="Total run time in seconds.")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Divide client-side timing (speech, poll cadence) by this factor.",
+    )
+    parser.add_argument("--segments", type=int, default=MAX_SEGMENTS, help="Synthetic transcript length.")
+    parser.add_argument("--transcripts", help="JSON file with recorded transcripts to replay.")
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0, help="Stubbed moderator LLM latency.")
+    parser.add_argument("--mint-latency-ms", type=float, default=300.0, help="Stubbed session mint latency.")
+    parser.add_argument("--base-url", help="Drive a running server instead of the in-process app.")
+    parser.add_argument("--json", dest="json_path", help="Write the report as JSON to this path.")
+    parser.add_argument(
+        "--log-level",
+        default="ERROR",
+        help="App log level for in-process runs (default ERROR keeps the report readable).",
+    )
+    args = parser.parse_args(argv)
+    if args.sessions < 1 or args.speed <= 0:
+        parser.error("--sessions must be >= 1 and --speed must be > 0")
+    return args
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(run_replay(args))
+    print(format_report(report))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 1 if any(
+        summary["errors"] for summary in report["endpoints"].values()  # type: ignore[union-attr]
+    ) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Microbenchmarks for the per-request moderator and session hot paths.
+
+Each case runs on synthetic transcripts of 10, 100 and 400 segments and is
+compared against the JSON baseline in ``benchmarks/baselines/micro.json``. The
+run exits non-zero when any case is slower than its baseline by more than the
+tolerance. Baselines are machine-specific: refresh them with ``--update`` on
+the machine that enforces the gate.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.micro                  # compare against the baseline
+    python -m benchmarks.micro --update         # rewrite the baseline
+    python -m benchmarks.micro --tolerance 0.5  # allow 50% slowdown
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from app.schemas.moderator import ModeratorGuidanceRequest
+from app.services.moderator_engine import moderator_engine
+from app.services.prompt_builder import prompt_builder
+from benchmarks.transcripts import SEGMENT_COUNTS, synthetic_transcript
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "micro.json"
+DEFAULT_TOLERANCE = 0.25
+REPEATS = 7
+# Regressed cases are re-measured this many times before the gate fails, so a
+# noisy neighbour on a shared runner does not fail the build on its own.
+CONFIRM_ATTEMPTS = 2
+
+
+def build_cases() -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {
+        "prompt_builder.build_session_config": lambda: prompt_builder.build_session_config(
+            "Benchmark Caller"
+        ),
+    }
+    for count in SEGMENT_COUNTS:
+        payload = {"session_id": "bench", "transcript": synthetic_transcript(count)}
+        request = ModeratorGuidanceRequest.model_validate(payload)
+        segments = request.transcript
+        status = moderator_engine._evaluate_checklist(segments)
+        tone = moderator_engine._measure_tone(segments)
+
+        cases[f"moderator._evaluate_checklist[{count}]"] = (
+            lambda segments=segments: moderator_engine._evaluate_checklist(segments)
+        )
+        cases[f"moderator._measure_tone[{count}]"] = (
+            lambda segments=segments: moderator_engine._measure_tone(segments)
+        )
+        cases[f"moderator._build_user_prompt[{count}]"] = (
+            lambda status=status, tone=tone, segments=segments: moderator_engine._build_user_prompt(
+                status, tone, segments
+            )
+        )
+        cases[f"ModeratorGuidanceRequest.model_validate[{count}]"] = (
+            lambda payload=payload: ModeratorGuidanceRequest.model_validate(payload)
+        )
+    return cases
+
+
+def measure(func: Callable[[], object]) -> float:
+    """Return the best per-call time in microseconds across ``REPEATS`` runs."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEATS, number=number))
+    return best / number * 1e6
+
+
+def run_cases(selected: str | None = None) -> Dict[str, float]:
+    return {
+        name: round(measure(func), 3)
+        for name, func in build_cases().items()
+        if selected is None or selected in name
+    }
+
+
+def confirm_regressions(
+    results: Dict[str, float], baseline: Dict[str, float], tolerance: float
+) -> None:
+    """Re-measure cases over the tolerance and keep their best observed time."""
+    cases = build_cases()
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for _ in range(CONFIRM_ATTEMPTS):
+            if current <= reference * (1 + tolerance):
+                break
+            current = min(current, round(measure(cases[name]), 3))
+        results[name] = current
+
+
+def load_baseline(path: Path) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def baseline_python(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8")).get("python")
+
+
+def write_baseline(path: Path, results: Dict[str, float]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "unit": "microseconds_per_call",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], tolerance: float
+) -> List[str]:
+    """Print a comparison table and return the names of regressed cases."""
+    regressions: List[str] = []
+    width = max(len(name) for name in results)
+    print(f"{'case':<{width}} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<{width}} {'-':>12} {current:>12.3f} {'new':>8}")
+            continue
+        change = (current - reference) / reference
+        flag = ""
+        if change > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<{width}} {reference:>12.3f} {current:>12.3f} {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown as a fraction of the baseline (default 0.25).",
+    )
+    parser.add_argument("--update", action="store_true", help="Rewrite the baseline file.")
+    parser.add_argument("-k", dest="selected", help="Only run cases whose name contains this.")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.selected)
+    if args.update:
+        merged = {**load_baseline(args.baseline), **results}
+        write_baseline(args.baseline, merged)
+        print(f"Wrote {len(results)} results to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    recorded_on = baseline_python(args.baseline)
+    running = platform.python_version()
+    if recorded_on and recorded_on.split(".")[:2] != running.split(".")[:2]:
+        print(
+            f"warning: baseline recorded on Python {recorded_on}, running "
+            f"{running}; re-record it with --update",
+            file=sys.stderr,
+        )
+    confirm_regressions(results, baseline, args.tolerance)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) regressed beyond {args.tolerance:.0%}: "
+            + ", ".join(regressions),
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
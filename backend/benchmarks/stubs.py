@@ -0,0 +1,114 @@
+"""Latency-configurable stand-ins for the external services the backend calls."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from app.config import settings
+from app.schemas.sessions import SessionConfig
+
+STUB_GUIDANCE = (
+    "<MODERATOR_GUIDANCE>\n"
+    "Checklist: rating still missing.\n"
+    "Coach: Acknowledge their answer, then ask for the rating.\n"
+    "Prompt: On a scale of 1 to 5, how satisfied are you overall right now?\n"
+    "</MODERATOR_GUIDANCE>"
+)
+STUB_STRUCTURED_GUIDANCE = (
+    '{"directive": "Acknowledge their answer, then ask for the rating.", '
+    '"target_item": "rating", '
+    '"suggested_phrase": "On a scale of 1 to 5, how satisfied are you overall?"}'
+)
+
+
+def _jittered(latency_s: float, jitter: float) -> float:
+    if latency_s <= 0:
+        return 0.0
+    return max(0.0, random.uniform(latency_s * (1 - jitter), latency_s * (1 + jitter)))
+
+
+class _StubCompletions:
+    def __init__(self, owner: "StubChatClient") -> None:
+        self._owner = owner
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        owner = self._owner
+        owner.calls += 1
+        owner.last_request = kwargs
+        delay = _jittered(owner.latency_s, owner.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        content = (
+            owner.structured_content if "response_format" in kwargs else owner.content
+        )
+        completion_tokens = max(1, len(content) // 4)
+        prompt_tokens = sum(
+            len(str(message.get("content", ""))) for message in kwargs["messages"]
+        ) // 4
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+
+class StubChatClient:
+    """Mimics ``AsyncOpenAI.chat.completions.create`` with a fixed response."""
+
+    def __init__(
+        self,
+        latency_s: float = 0.0,
+        jitter: float = 0.2,
+        content: str = STUB_GUIDANCE,
+        structured_content: str = STUB_STRUCTURED_GUIDANCE,
+    ) -> None:
+        self.latency_s = latency_s
+        self.jitter = jitter
+        self.content = content
+        self.structured_content = structured_content
+        self.calls = 0
+        self.last_request: dict[str, Any] | None = None
+        self.chat = SimpleNamespace(completions=_StubCompletions(self))
+
+
+def make_stub_mint_session(latency_s: float = 0.0, jitter: float = 0.2):
+    """Return a coroutine function with the same contract as ``mint_session``."""
+
+    async def mint_session(config: SessionConfig) -> tuple[str, datetime, str]:
+        delay = _jittered(latency_s, jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        expires_at = datetime.now(UTC) + timedelta(seconds=60)
+        return f"ek_stub_{uuid4().hex}", expires_at, "https://stub.invalid/realtime"
+
+    return mint_session
+
+
+def install_stubs(
+    llm_latency_s: float = 0.0,
+    mint_latency_s: float = 0.0,
+    jitter: float = 0.2,
+) -> StubChatClient:
+    """Patch the moderator client and session minting in-process."""
+    from app.api import sessions as sessions_api
+    from app.services.moderator_engine import moderator_engine
+
+    client = StubChatClient(latency_s=llm_latency_s, jitter=jitter)
+    moderator_engine._client = client
+    moderator_engine._model = moderator_engine._model or "stub-moderator"
+    # A distinct fast model keeps routing on, so stubbed runs cover both routes.
+    moderator_engine._fast_model = (
+        moderator_engine._fast_model
+        or settings.openai_moderator_fast_model
+        or "stub-fast"
+    )
+    sessions_api.mint_session = make_stub_mint_session(mint_latency_s, jitter)
+    return client
@@ -0,0 +1,72 @@
+"""Synthetic and recorded survey transcripts for benchmarks."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from itertools import cycle
+from pathlib import Path
+from typing import Dict, List
+
+from app.schemas.moderator import TranscriptSegment
+
+# One exchange per checklist item, followed by small talk that keeps the
+# transcript growing without completing anything new.
+SCRIPT: List[tuple[str, str]] = [
+    ("agent", "Hi there! Do you have a minute for a quick satisfaction survey?"),
+    ("customer", "Sure, I have a few minutes."),
+    ("agent", "On a scale of one to five, how would you rate us overall?"),
+    ("customer", "I would say a 4 overall."),
+    ("agent", "What has been the highlight for you recently?"),
+    ("customer", "I really enjoy how quickly the team replies."),
+    ("agent", "What has been the main frustration?"),
+    ("customer", "Billing was a problem last month and I was annoyed."),
+    ("agent", "What is one change you would suggest?"),
+    ("customer", "I wish invoices were clearer."),
+    ("agent", "Thank you, let me give you a quick summary."),
+    ("customer", "Sounds good."),
+]
+
+FILLER: List[tuple[str, str]] = [
+    ("agent", "Could you tell me a bit more about that?"),
+    ("customer", "It mostly happens at the end of the month when things are busy."),
+    ("agent", "That makes sense, I appreciate the detail."),
+    ("customer", "No worries, happy to help where I can."),
+]
+
+SEGMENT_COUNTS = (10, 100, 400)
+# Mid-call transcripts with several checklist items still open; these are the
+# ones the moderator routes to the fast model.
+PARTIAL_SEGMENT_COUNTS = (2, 4, 6)
+
+
+def synthetic_transcript(length: int, start: datetime | None = None) -> List[Dict[str, str]]:
+    """Return ``length`` JSON-ready segments that walk through the checklist."""
+    start = start or datetime(2025, 1, 1, tzinfo=UTC)
+    lines = SCRIPT[:length]
+    filler = cycle(FILLER)
+    while len(lines) < length:
+        lines.append(next(filler))
+    return [
+        {
+            "actor": actor,
+            "text": text,
+            "timestamp": (start + timedelta(seconds=4 * index)).isoformat(),
+        }
+        for index, (actor, text) in enumerate(lines)
+    ]
+
+
+def synthetic_segments(length: int) -> List[TranscriptSegment]:
+    return [TranscriptSegment(**segment) for segment in synthetic_transcript(length)]
+
+
+def load_recorded(path: Path) -> List[List[Dict[str, str]]]:
+    """Load transcripts from a JSON file (a list of transcripts or a single one)."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data and isinstance(data[0], dict):
+        data = [data]
+    return [
+        [TranscriptSegment(**segment).model_dump() for segment in transcript]
+        for transcript in data
+    ]
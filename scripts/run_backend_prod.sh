@@ -0,0 +1,25 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+BACKEND_DIR="$ROOT_DIR/backend"
+ENV_DIR="$BACKEND_DIR/.venv"
+
+cd "$BACKEND_DIR"
+
+# Workers share session state through SQLite unless told otherwise.
+export SESSION_STORE="${SESSION_STORE:-sqlite}"
+
+if command -v uv >/dev/null 2>&1; then
+  export UV_PROJECT_ENVIRONMENT="$ENV_DIR"
+  uv sync --frozen
+  uv run python -m app.server "$@"
+else
+  if [ ! -f "$ENV_DIR/pyvenv.cfg" ]; then
+    echo "Backend virtual environment missing; run scripts/run_backend.sh once first" >&2
+    exit 1
+  fi
+  # shellcheck disable=SC1090
+  source "$ENV_DIR/bin/activate"
+  python -m app.server "$@"
+fi